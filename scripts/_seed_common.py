@@ -0,0 +1,77 @@
+"""Shared constants and helpers for the metric seed scripts."""
+
+import functools
+import json
+import re
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once per process. Every seed script imports this instead of calling
+# os.path.expanduser on its own copy of the string.
+DB_PATH = Path.home() / "Library/Application Support/com.kiingo.localcli/state.sqlite"
+
+# One timestamp per seed run; every row written by the run shares it.
+# isoformat emits the same "+00:00"-suffixed string as the old strftime
+# pattern without a format-string parse.
+NOW = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+def connect():
+    """Open the app database the way the seeds expect.
+
+    WAL matches what the Tauri app already runs the database in, so a seed
+    executing while the app is open appends to the log instead of fighting it
+    for the rollback-journal lock; synchronous=NORMAL is the pairing WAL is
+    designed for. busy_timeout keeps the previous per-script setting.
+
+    isolation_level=None turns off the driver's implicit BEGIN before each
+    DML statement — run_seed drives the transaction explicitly — and the
+    larger statement cache keeps the hoisted upsert SQL prepared across the
+    SELECT/INSERT pairs seed_all issues per metric.
+    """
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, cached_statements=256)
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+# orjson emits bytes; without this adapter they would land in the TEXT
+# columns as BLOBs, which the app's Rust reader rejects. Decoding at bind
+# time keeps dumps_raw() callers from paying a .decode() for payloads that
+# only ever travel into the database.
+sqlite3.register_adapter(bytes, lambda b: b.decode("utf-8"))
+
+if orjson is not None:
+    def dumps(obj):
+        """Serialize to compact JSON via orjson when it is installed."""
+        return orjson.dumps(obj).decode()
+
+    # Raw orjson output, for values headed straight into an INSERT parameter;
+    # the bytes adapter above handles the TEXT conversion.
+    dumps_raw = orjson.dumps
+else:
+    # Compact separators match orjson's output, so snapshots are byte-identical
+    # whichever serializer is picked up.
+    dumps = functools.partial(json.dumps, separators=(",", ":"))
+    dumps_raw = dumps
+
+_PLACEHOLDER_RE = re.compile(r"[A-Z][A-Z0-9_]*_PLACEHOLDER")
+
+
+def render_template(template, subs):
+    """Fill FOO_PLACEHOLDER tokens in a JSX template in a single pass.
+
+    `subs` maps placeholder tokens to already-formatted replacement strings.
+    One regex scan replaces the chain of per-token str.replace calls, so the
+    template is walked (and reallocated) once instead of once per token.
+    An unknown token raises KeyError rather than silently surviving into the
+    rendered snapshot.
+    """
+    return _PLACEHOLDER_RE.sub(lambda match: subs[match.group(0)], template)
@@ -0,0 +1,105 @@
+"""Shared seed driver: one connection, one transaction, one upsert routine.
+
+Each seed script exports a SEED dict and a main() that hands it to
+run_seed(); seed_all.py passes every SEED through a single connection so
+the whole suite pays for one open and one commit instead of N.
+"""
+
+from secrets import token_hex
+
+from _seed_common import NOW, connect
+
+# Hoisted so sqlite's statement cache keys on the identical string every time
+# upsert_metric runs; seed_all drives this once per seed over one connection.
+SQL_INSERT_METRIC_DEF = """INSERT INTO metric_definitions
+   (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)
+   ON CONFLICT(slug) DO NOTHING
+   RETURNING id"""
+
+SQL_INSERT_METRIC_SNAPSHOT = """INSERT INTO metric_snapshots
+   (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
+   VALUES (?, ?, ?, ?, 'completed', ?, ?)"""
+
+SQL_INSERT_SCREEN_METRIC = """INSERT INTO screen_metrics
+   (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def upsert_metric(conn, seed):
+    """Insert one metric definition, initial snapshot, and screen binding.
+
+    `seed` carries slug, name, instructions, template_html, ttl_seconds,
+    metadata_json, a build_payload() callable returning (values_json,
+    rendered_html), and a screen spec. Safe to re-run: existing rows are
+    skipped, and the payload is only built when the insert actually happens.
+    """
+    slug = seed["slug"]
+
+    row = conn.execute("SELECT id FROM metric_definitions WHERE slug = ?", (slug,)).fetchone()
+    if row:
+        print(f"  SKIP  {slug} (already exists)")
+        metric_id = row[0]
+    else:
+        initial_values, initial_html = seed["build_payload"]()
+        metric_id = token_hex(16)
+        snapshot_id = token_hex(16)
+
+        # ON CONFLICT closes the check-then-insert race when seeds run in
+        # parallel; slug is UNIQUE in the app schema.
+        row = conn.execute(
+            SQL_INSERT_METRIC_DEF,
+            (metric_id, seed["name"], slug, seed["instructions"], seed["template_html"],
+             seed["ttl_seconds"], seed["metadata_json"], NOW, NOW)
+        ).fetchone()
+        if row is None:
+            # Lost the race to a concurrent seeder; reuse its row.
+            print(f"  SKIP  {slug} (already exists)")
+            metric_id = conn.execute(
+                "SELECT id FROM metric_definitions WHERE slug = ?", (slug,)
+            ).fetchone()[0]
+        else:
+            conn.execute(
+                SQL_INSERT_METRIC_SNAPSHOT,
+                (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
+            )
+            print(f"  ADD   {slug}")
+
+    # The app intentionally allows multiple widgets per (screen, metric) —
+    # the multi-widget migration dropped that UNIQUE constraint — so the
+    # binding stays a point lookup rather than an INSERT OR IGNORE.
+    screen = seed["screen"]
+    screen_id = screen["screen_id"]
+    bound = conn.execute(
+        "SELECT 1 FROM screen_metrics WHERE screen_id = ? AND metric_id = ? LIMIT 1",
+        (screen_id, metric_id),
+    ).fetchone()
+    if bound:
+        print(f"  SKIP  {slug} already bound to {screen_id}")
+    else:
+        grid_x, grid_y, grid_w, grid_h = screen["grid"]
+        conn.execute(
+            SQL_INSERT_SCREEN_METRIC,
+            (token_hex(16), screen_id, metric_id, screen["position"], screen["layout_hint"],
+             grid_x, grid_y, grid_w, grid_h),
+        )
+        print(f"  BIND  {slug} -> {screen_id} ({grid_w}x{grid_h})")
+
+
+def run_seed(*seeds):
+    """Upsert the given SEED specs over one connection in one transaction."""
+    conn = connect()
+    # connect() opens in autocommit (isolation_level=None); one explicit
+    # transaction covers every seed, and IMMEDIATE takes the write lock up
+    # front instead of on the first INSERT.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for seed in seeds:
+            upsert_metric(conn, seed)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    print("\nDone")
@@ -7,9 +7,8 @@ Safe to re-run — skips if bindings already exist.
 
 import sqlite3
 import uuid
-import os
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
+from _seed_common import DB_PATH
 
 BINDINGS = [
     {
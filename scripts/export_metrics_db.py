@@ -10,7 +10,8 @@ import sqlite3
 import os
 import sys
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
+from _seed_common import DB_PATH
+
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_PATH = os.path.join(REPO_ROOT, "db", "metrics_backup.sql")
 
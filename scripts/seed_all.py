@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Seed every metric through one connection and one transaction.
+
+The individual seed scripts still run standalone; this driver exists so a
+full seed pays for one sqlite open and one commit instead of one per script.
+Add a module's SEED here as scripts are converted to the shared helper.
+"""
+
+import seed_revenue_tracker
+import seed_sales_followup_snapshot
+import seed_sales_response_rate
+import seed_sales_scorecard
+import seed_trailing_followup_calls
+import seed_upcoming_cohort_calendar
+
+from _seed_helpers import run_seed
+
+SEEDS = [
+    seed_revenue_tracker.SEED,
+    seed_sales_followup_snapshot.SEED,
+    seed_sales_response_rate.SEED,
+    seed_sales_scorecard.SEED,
+    seed_trailing_followup_calls.SEED,
+    seed_upcoming_cohort_calendar.SEED,
+]
+
+
+def main():
+    run_seed(*SEEDS)
+
+
+if __name__ == "__main__":
+    main()
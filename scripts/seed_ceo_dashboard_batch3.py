@@ -5,10 +5,10 @@ path1-champions, path1-accelerator, path2-pipeline, path2-deployed, path2-fde.""
 import sqlite3
 import uuid
 import json
-import os
 from datetime import datetime, timezone
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
+from _seed_common import DB_PATH
+
 NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
 metrics = []
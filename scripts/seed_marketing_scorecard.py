@@ -4,10 +4,10 @@
 import sqlite3
 import uuid
 import json
-import os
 from datetime import datetime, timezone
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
+from _seed_common import DB_PATH
+
 NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
 SLUG = "marketing-scorecard"
@@ -172,15 +172,16 @@ latest_webinar = 73
 latest_organic = 175
 latest_page_views = 907
 
-initial_values = json.dumps({
-    "weeks": weeks_data,
-    "latestWeek": "2/9",
-    "latestLeads": latest_leads,
-    "latestNewsletter": latest_newsletter,
-    "latestWebinar": latest_webinar,
-    "latestOrganic": latest_organic,
-    "latestPageViews": latest_page_views,
-})
+def make_initial_values():
+    return json.dumps({
+        "weeks": weeks_data,
+        "latestWeek": "2/9",
+        "latestLeads": latest_leads,
+        "latestNewsletter": latest_newsletter,
+        "latestWebinar": latest_webinar,
+        "latestOrganic": latest_organic,
+        "latestPageViews": latest_page_views,
+    })
 
 
 def make_initial_html():
@@ -195,8 +196,6 @@ def make_initial_html():
     return html
 
 
-initial_html = make_initial_html()
-
 METADATA = json.dumps({
     "aliases": ["marketing scorecard", "marketing metrics", "weekly marketing"],
 })
@@ -207,34 +206,50 @@ def main():
     conn.execute("PRAGMA busy_timeout = 5000")
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
+    # Check if metric already exists; skip all payload building on the hit path
+    row = cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,)).fetchone()
+    if row:
         print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
+        metric_id = row[0]
     else:
+        initial_values = make_initial_values()
+        initial_html = make_initial_html()
         metric_id = str(uuid.uuid4())
         snapshot_id = str(uuid.uuid4())
 
-        cursor.execute(
+        # ON CONFLICT closes the check-then-insert race when seeds run in
+        # parallel; slug is UNIQUE in the app schema.
+        row = cursor.execute(
             """INSERT INTO metric_definitions
                (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)
+               ON CONFLICT(slug) DO NOTHING
+               RETURNING id""",
             (metric_id, NAME, SLUG, instructions, template_jsx, 259200, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
+        ).fetchone()
+        if row is None:
+            # Lost the race to a concurrent seeder; reuse its row.
+            print(f"  SKIP  {SLUG} (already exists)")
+            metric_id = cursor.execute(
+                "SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,)
+            ).fetchone()[0]
+        else:
+            cursor.execute(
+                """INSERT INTO metric_snapshots
+                   (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
+                   VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
+                (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
+            )
+            print(f"  ADD   {SLUG}")
+
+    # The app intentionally allows multiple widgets per (screen, metric) —
+    # the multi-widget migration dropped that UNIQUE constraint — so the
+    # binding stays a point lookup rather than an INSERT OR IGNORE.
+    bound = cursor.execute(
+        "SELECT 1 FROM screen_metrics WHERE screen_id = ? AND metric_id = ? LIMIT 1",
         (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
+    ).fetchone()
+    if bound:
         print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
     else:
         binding_id = str(uuid.uuid4())
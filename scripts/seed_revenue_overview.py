@@ -4,10 +4,10 @@
 import sqlite3
 import uuid
 import json
-import os
 from datetime import datetime, timezone
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
+from _seed_common import DB_PATH, render_template
+
 NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
 SLUG = "revenue-overview"
@@ -227,54 +227,53 @@ current_month_rev = 68799
 mom_growth = round((current_month_rev - prior_month) / prior_month * 100)
 avg_monthly = round(ltm_revenue / 12)
 
-initial_values = json.dumps({
-    "currentMonthRevenue": current_month_rev,
-    "currentMonthInvoiced": 49799,
-    "outstanding": 19000,
-    "dealCount": 13,
-    "avgDealSize": 5292,
-    "newBizRevenue": 57800,
-    "newBizCount": 11,
-    "upsellRevenue": 10999,
-    "upsellCount": 2,
-    "byService": by_service,
-    "topDeals": tracker_deals,
-    "monthLabel": "February 2026",
-    "monthlyTrend": monthly_trend,
-    "ltmRevenue": ltm_revenue,
-    "ltmCollected": ltm_collected,
-    "collectionRate": collection_rate,
-    "priorMonthRevenue": prior_month,
-    "momGrowth": mom_growth,
-    "avgMonthlyRevenue": avg_monthly,
-})
+def make_initial_values():
+    return json.dumps({
+        "currentMonthRevenue": current_month_rev,
+        "currentMonthInvoiced": 49799,
+        "outstanding": 19000,
+        "dealCount": 13,
+        "avgDealSize": 5292,
+        "newBizRevenue": 57800,
+        "newBizCount": 11,
+        "upsellRevenue": 10999,
+        "upsellCount": 2,
+        "byService": by_service,
+        "topDeals": tracker_deals,
+        "monthLabel": "February 2026",
+        "monthlyTrend": monthly_trend,
+        "ltmRevenue": ltm_revenue,
+        "ltmCollected": ltm_collected,
+        "collectionRate": collection_rate,
+        "priorMonthRevenue": prior_month,
+        "momGrowth": mom_growth,
+        "avgMonthlyRevenue": avg_monthly,
+    })
 
 # Build initial HTML using template substitution
 def make_initial_html():
-    html = template_jsx
-    html = html.replace("CURRENT_MONTH_REVENUE_PLACEHOLDER", str(current_month_rev))
-    html = html.replace("CURRENT_MONTH_INVOICED_PLACEHOLDER", str(49799))
-    html = html.replace("OUTSTANDING_PLACEHOLDER", str(19000))
-    html = html.replace("DEAL_COUNT_PLACEHOLDER", str(13))
-    html = html.replace("AVG_DEAL_SIZE_PLACEHOLDER", str(5292))
-    html = html.replace("NEW_BIZ_REVENUE_PLACEHOLDER", str(57800))
-    html = html.replace("NEW_BIZ_COUNT_PLACEHOLDER", str(11))
-    html = html.replace("UPSELL_REVENUE_PLACEHOLDER", str(10999))
-    html = html.replace("UPSELL_COUNT_PLACEHOLDER", str(2))
-    html = html.replace("BY_SERVICE_PLACEHOLDER", json.dumps(by_service))
-    html = html.replace("TOP_DEALS_PLACEHOLDER", json.dumps(tracker_deals))
-    html = html.replace("MONTH_LABEL_PLACEHOLDER", '"February 2026"')
-    html = html.replace("MONTHLY_TREND_PLACEHOLDER", json.dumps(monthly_trend))
-    html = html.replace("LTM_REVENUE_PLACEHOLDER", str(ltm_revenue))
-    html = html.replace("LTM_COLLECTED_PLACEHOLDER", str(ltm_collected))
-    html = html.replace("COLLECTION_RATE_PLACEHOLDER", str(collection_rate))
-    html = html.replace("PRIOR_MONTH_REVENUE_PLACEHOLDER", str(prior_month))
-    html = html.replace("MOM_GROWTH_PLACEHOLDER", str(mom_growth))
-    html = html.replace("AVG_MONTHLY_REVENUE_PLACEHOLDER", str(avg_monthly))
-    return html
-
-
-initial_html = make_initial_html()
+    return render_template(template_jsx, {
+        "CURRENT_MONTH_REVENUE_PLACEHOLDER": str(current_month_rev),
+        "CURRENT_MONTH_INVOICED_PLACEHOLDER": str(49799),
+        "OUTSTANDING_PLACEHOLDER": str(19000),
+        "DEAL_COUNT_PLACEHOLDER": str(13),
+        "AVG_DEAL_SIZE_PLACEHOLDER": str(5292),
+        "NEW_BIZ_REVENUE_PLACEHOLDER": str(57800),
+        "NEW_BIZ_COUNT_PLACEHOLDER": str(11),
+        "UPSELL_REVENUE_PLACEHOLDER": str(10999),
+        "UPSELL_COUNT_PLACEHOLDER": str(2),
+        "BY_SERVICE_PLACEHOLDER": json.dumps(by_service),
+        "TOP_DEALS_PLACEHOLDER": json.dumps(tracker_deals),
+        "MONTH_LABEL_PLACEHOLDER": '"February 2026"',
+        "MONTHLY_TREND_PLACEHOLDER": json.dumps(monthly_trend),
+        "LTM_REVENUE_PLACEHOLDER": str(ltm_revenue),
+        "LTM_COLLECTED_PLACEHOLDER": str(ltm_collected),
+        "COLLECTION_RATE_PLACEHOLDER": str(collection_rate),
+        "PRIOR_MONTH_REVENUE_PLACEHOLDER": str(prior_month),
+        "MOM_GROWTH_PLACEHOLDER": str(mom_growth),
+        "AVG_MONTHLY_REVENUE_PLACEHOLDER": str(avg_monthly),
+    })
+
 
 METADATA = json.dumps({
     "dependencies": ["monthly-revenue-tracker", "monthly-revenue"],
@@ -287,36 +286,51 @@ def main():
     conn.execute("PRAGMA busy_timeout = 5000")
     cursor = conn.cursor()
 
-    # Check if metric already exists
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
+    # Check if metric already exists; skip all payload building on the hit path
+    row = cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,)).fetchone()
+    if row:
         print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
+        metric_id = row[0]
     else:
+        initial_values = make_initial_values()
+        initial_html = make_initial_html()
         metric_id = str(uuid.uuid4())
         snapshot_id = str(uuid.uuid4())
 
-        cursor.execute(
+        # ON CONFLICT closes the check-then-insert race when seeds run in
+        # parallel; slug is UNIQUE in the app schema.
+        row = cursor.execute(
             """INSERT INTO metric_definitions
                (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)
+               ON CONFLICT(slug) DO NOTHING
+               RETURNING id""",
             (metric_id, NAME, SLUG, instructions, template_jsx, 259200, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
+        ).fetchone()
+        if row is None:
+            # Lost the race to a concurrent seeder; reuse its row.
+            print(f"  SKIP  {SLUG} (already exists)")
+            metric_id = cursor.execute(
+                "SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,)
+            ).fetchone()[0]
+        else:
+            cursor.execute(
+                """INSERT INTO metric_snapshots
+                   (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
+                   VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
+                (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
+            )
+            print(f"  ADD   {SLUG}")
 
     # Bind to screen if not already bound
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
+    # The app intentionally allows multiple widgets per (screen, metric) —
+    # the multi-widget migration dropped that UNIQUE constraint — so the
+    # binding stays a point lookup rather than an INSERT OR IGNORE.
+    bound = cursor.execute(
+        "SELECT 1 FROM screen_metrics WHERE screen_id = ? AND metric_id = ? LIMIT 1",
         (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
+    ).fetchone()
+    if bound:
         print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
     else:
         binding_id = str(uuid.uuid4())
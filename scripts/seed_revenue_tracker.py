@@ -1,14 +1,8 @@
 #!/usr/bin/env python3
 """Seed: Monthly Revenue Tracker metric from Sohrab's OneDrive Excel file."""
 
-import sqlite3
-import uuid
-import json
-import os
-from datetime import datetime, timezone
-
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import dumps_raw
+from _seed_helpers import run_seed
 
 SLUG = "monthly-revenue-tracker"
 NAME = "Monthly Revenue Tracker"
@@ -92,9 +86,9 @@ Kiingo MCP `excel` module reading from Sohrab Azad's OneDrive.
 template_jsx = r"""(() => {
   const totalRevenue = TOTAL_REVENUE_PLACEHOLDER;
   const totalInvoiced = TOTAL_INVOICED_PLACEHOLDER;
-  const outstanding = OUTSTANDING_PLACEHOLDER;
+  const outstanding = OUTSTANDING_INVOICE_PLACEHOLDER;
   const dealCount = DEAL_COUNT_PLACEHOLDER;
-  const avgDeal = AVG_DEAL_PLACEHOLDER;
+  const avgDeal = AVG_DEAL_SIZE_PLACEHOLDER;
   const newBizCount = NEW_BIZ_COUNT_PLACEHOLDER;
   const newBizRevenue = NEW_BIZ_REVENUE_PLACEHOLDER;
   const upsellCount = UPSELL_COUNT_PLACEHOLDER;
@@ -178,111 +172,75 @@ feb_deals = [
     {"client": "Brody Brothers", "amount": 2500, "invoiced": 0, "service": "AI Foundational Bootcamp (2 users)", "type": "New Biz", "closeDate": "Feb 15", "payment": ""},
 ]
 
-by_service_map = {}
-for d in feb_deals:
-    svc = d["service"].split("(")[0].strip()
-    if svc not in by_service_map:
-        by_service_map[svc] = {"service": svc, "count": 0, "revenue": 0}
-    by_service_map[svc]["count"] += 1
-    by_service_map[svc]["revenue"] += d["amount"]
-by_service = sorted(by_service_map.values(), key=lambda x: -x["revenue"])
-
-total_rev = sum(d["amount"] for d in feb_deals)
-total_inv = sum(d["invoiced"] for d in feb_deals)
-new_biz = [d for d in feb_deals if "New" in d["type"]]
-upsells = [d for d in feb_deals if "Upsell" in d["type"]]
-
-initial_values = json.dumps({
-    "totalRevenue": total_rev,
-    "totalInvoiced": total_inv,
-    "outstandingInvoice": total_rev - total_inv,
-    "dealCount": len(feb_deals),
-    "avgDealSize": round(total_rev / len(feb_deals)),
-    "newBizCount": len(new_biz),
-    "newBizRevenue": sum(d["amount"] for d in new_biz),
-    "upsellCount": len(upsells),
-    "upsellRevenue": sum(d["amount"] for d in upsells),
-    "byService": by_service,
-    "deals": feb_deals,
-    "monthLabel": "February 2026",
-})
-
-# Build initial rendered HTML by substituting placeholders
-def make_initial_html():
-    fmt_deals = json.dumps(feb_deals)
-    fmt_by_service = json.dumps(by_service)
-    new_biz_rev = sum(d["amount"] for d in new_biz)
-    upsell_rev = sum(d["amount"] for d in upsells)
-
-    # Use the template_jsx and substitute PLACEHOLDER tokens with actual values
-    html = template_jsx
-    html = html.replace("TOTAL_REVENUE_PLACEHOLDER", str(total_rev))
-    html = html.replace("TOTAL_INVOICED_PLACEHOLDER", str(total_inv))
-    html = html.replace("OUTSTANDING_PLACEHOLDER", str(total_rev - total_inv))
-    html = html.replace("DEAL_COUNT_PLACEHOLDER", str(len(feb_deals)))
-    html = html.replace("AVG_DEAL_PLACEHOLDER", str(round(total_rev / len(feb_deals))))
-    html = html.replace("NEW_BIZ_COUNT_PLACEHOLDER", str(len(new_biz)))
-    html = html.replace("NEW_BIZ_REVENUE_PLACEHOLDER", str(new_biz_rev))
-    html = html.replace("UPSELL_COUNT_PLACEHOLDER", str(len(upsells)))
-    html = html.replace("UPSELL_REVENUE_PLACEHOLDER", str(upsell_rev))
-    html = html.replace("BY_SERVICE_PLACEHOLDER", fmt_by_service)
-    html = html.replace("DEALS_PLACEHOLDER", fmt_deals)
-    html = html.replace("MONTH_LABEL_PLACEHOLDER", '"February 2026"')
-    return html
-
-
-initial_html = make_initial_html()
+# Deferred until main() knows the metric is missing; the SKIP path never
+# aggregates, serializes, or renders anything.
+def _build_initial_payload():
+    # Single pass over the deals: totals, new-biz/upsell splits, and the
+    # per-service rollup all accumulate together instead of sweeping the list
+    # once per aggregate.
+    by_service_map = {}
+    total_rev = 0
+    total_inv = 0
+    new_biz_count = 0
+    new_biz_rev = 0
+    upsell_count = 0
+    upsell_rev = 0
+    for d in feb_deals:
+        amount = d["amount"]
+        total_rev += amount
+        total_inv += d["invoiced"]
+        # The type column only ever holds "New Biz" or "Upsell", so a direct
+        # comparison beats a substring scan.
+        t = d["type"]
+        if t == "New Biz":
+            new_biz_count += 1
+            new_biz_rev += amount
+        elif t == "Upsell":
+            upsell_count += 1
+            upsell_rev += amount
+        svc = d["service"].partition("(")[0].rstrip()
+        entry = by_service_map.get(svc)
+        if entry is None:
+            by_service_map[svc] = entry = {"service": svc, "count": 0, "revenue": 0}
+        entry["count"] += 1
+        entry["revenue"] += amount
+    by_service = sorted(by_service_map.values(), key=lambda x: -x["revenue"])
+
+    initial_values = dumps_raw({
+        "totalRevenue": total_rev,
+        "totalInvoiced": total_inv,
+        "outstandingInvoice": total_rev - total_inv,
+        "dealCount": len(feb_deals),
+        "avgDealSize": round(total_rev / len(feb_deals)),
+        "newBizCount": new_biz_count,
+        "newBizRevenue": new_biz_rev,
+        "upsellCount": upsell_count,
+        "upsellRevenue": upsell_rev,
+        "byService": by_service,
+        "deals": feb_deals,
+        "monthLabel": "February 2026",
+    })
+
+    # rendered_html stays empty; the app renders template_html from these
+    # values on read (renderMetricTemplate), so the inlined copy is redundant.
+    return initial_values, ""
+
+
+
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 259200,
+    "metadata_json": "{}",
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 0, "layout_hint": "full", "grid": (0, 0, 12, 14)},
+}
 
 
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA busy_timeout = 5000")
-    cursor = conn.cursor()
-
-    # Check if metric already exists
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, '{}', ?, ?)""",
-            (metric_id, NAME, SLUG, instructions, template_jsx, 259200, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    # Bind to screen if not already bound
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 0, "full", 0, 0, 12, 14),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (12x14)")
-
-    conn.commit()
-    conn.close()
-    print("\nDone")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
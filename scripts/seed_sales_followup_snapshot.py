@@ -1,14 +1,8 @@
 #!/usr/bin/env python3
 """Seed: Sales Follow-Up Snapshot — daily pipeline follow-up health from CRM SharePoint."""
 
-import sqlite3
-import uuid
-import json
-import os
-from datetime import datetime, timezone
-
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import dumps, dumps_raw
+from _seed_helpers import run_seed
 
 SLUG = "sales-followup-snapshot"
 NAME = "Sales Follow-Up Snapshot"
@@ -93,9 +87,9 @@ For `repBreakdown`, extract the rep name from the email (part before @), compute
 template_jsx = r"""(() => {
   const totalOpenDeals = TOTAL_OPEN_DEALS_PLACEHOLDER;
   const likelyCold = LIKELY_COLD_PLACEHOLDER;
-  const overdueFollowUps = OVERDUE_FOLLOWUPS_PLACEHOLDER;
-  const avgDays = AVG_DAYS_PLACEHOLDER;
-  const followUpRanges = FOLLOWUP_RANGES_PLACEHOLDER;
+  const overdueFollowUps = OVERDUE_FOLLOW_UPS_PLACEHOLDER;
+  const avgDays = AVG_DAYS_SINCE_CONTACT_PLACEHOLDER;
+  const followUpRanges = FOLLOW_UP_RANGES_PLACEHOLDER;
   const repBreakdown = REP_BREAKDOWN_PLACEHOLDER;
   const generatedAt = GENERATED_AT_PLACEHOLDER;
 
@@ -168,86 +162,46 @@ rep_breakdown = [
     {"rep": "jordan", "totalDeals": 1, "active": 1, "likelyCold": 0, "coldPct": 0},
 ]
 
-initial_values = json.dumps({
-    "generatedAt": "2/18/2026",
-    "totalOpenDeals": 189,
-    "withDiscovery": 132,
-    "withoutDiscovery": 57,
-    "likelyCold": 43,
-    "overdueFollowUps": 21,
-    "followUpNeeded": 0,
-    "avgDaysSinceContact": 9.4,
-    "followUpRanges": followup_ranges,
-    "repBreakdown": rep_breakdown,
+# Deferred until main() knows the metric is missing; the SKIP path never
+# serializes or renders anything.
+def _build_initial_payload():
+    initial_values = dumps_raw({
+        "generatedAt": "2/18/2026",
+        "totalOpenDeals": 189,
+        "withDiscovery": 132,
+        "withoutDiscovery": 57,
+        "likelyCold": 43,
+        "overdueFollowUps": 21,
+        "followUpNeeded": 0,
+        "avgDaysSinceContact": 9.4,
+        "followUpRanges": followup_ranges,
+        "repBreakdown": rep_breakdown,
+    })
+
+    # rendered_html stays empty; the app renders template_html from these
+    # values on read (renderMetricTemplate), so the inlined copy is redundant.
+    return initial_values, ""
+
+
+METADATA = dumps({
+    "aliases": ["sales follow-up", "sales followup", "follow-up snapshot", "pipeline health"],
 })
 
 
-def make_initial_html():
-    html = template_jsx
-    html = html.replace("TOTAL_OPEN_DEALS_PLACEHOLDER", "189")
-    html = html.replace("LIKELY_COLD_PLACEHOLDER", "43")
-    html = html.replace("OVERDUE_FOLLOWUPS_PLACEHOLDER", "21")
-    html = html.replace("AVG_DAYS_PLACEHOLDER", "9.4")
-    html = html.replace("FOLLOWUP_RANGES_PLACEHOLDER", json.dumps(followup_ranges))
-    html = html.replace("REP_BREAKDOWN_PLACEHOLDER", json.dumps(rep_breakdown))
-    html = html.replace("GENERATED_AT_PLACEHOLDER", '"2/18/2026"')
-    return html
-
-
-initial_html = make_initial_html()
-
-METADATA = json.dumps({
-    "aliases": ["sales follow-up", "sales followup", "follow-up snapshot", "pipeline health"],
-})
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 86400,
+    "metadata_json": METADATA,
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 2, "layout_hint": "wide", "grid": (0, 24, 8, 14)},
+}
 
 
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA busy_timeout = 5000")
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
-            (metric_id, NAME, SLUG, instructions, template_jsx, 86400, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 2, "wide", 0, 24, 8, 14),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (8x14)")
-
-    conn.commit()
-    conn.close()
-    print("Done")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Seed: Sales Response Rate — email response rate from Kiingo CRM database."""
 
-import sqlite3
-import uuid
 import json
-import os
-from datetime import datetime, timezone
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import render_template
+from _seed_helpers import run_seed
 
 SLUG = "sales-response-rate"
 NAME = "Sales Response Rate"
@@ -19,16 +15,36 @@ instructions = r"""Calculate email response rates for deal-linked outreach by qu
 ## Data Source
 Kiingo PostgreSQL database → `crm_email`, `crm_deal_email`, `crm_deal` tables
 
+## Index Prerequisites
+Run once (outside a transaction) before the first refresh; every query below
+leans on these. The covering INCLUDE lets the thread-first scan stay
+index-only instead of heap-fetching each row for "from", and the partial
+index keeps the deal probe to open deals only.
+
+```sql
+CREATE INDEX CONCURRENTLY IF NOT EXISTS crm_email_conv_time_from
+  ON crm_email ("conversationId", "receivedDateTime") INCLUDE ("from")
+  WHERE "conversationId" IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS crm_deal_email_deal_email
+  ON crm_deal_email ("crmDealId", "crmEmailId");
+CREATE INDEX CONCURRENTLY IF NOT EXISTS crm_deal_open
+  ON crm_deal (id) WHERE "isClosed" = false;
+```
+
 ## Retrieval Steps
 
-### Step 1: Overall response rate
-For conversations linked to open deals where Kiingo sent the first message, calculate how many got an external reply.
+### Step 1: Build the initiated-threads working set
+One round-trip materializes every deal-linked thread Kiingo initiated into a
+session-scoped temp table; all later steps aggregate that one scan instead of
+re-deriving the same CTE chain four times. The `sql` tool keeps one session
+per database, so the temp table survives across the queries below.
 
 ```typescript
 import { sql } from 'tools';
-const overall = await sql.query({
+await sql.query({
   database: 'kiingo',
   sql: `
+    CREATE TEMP TABLE IF NOT EXISTS initiated_threads AS
     WITH deal_emails AS (
       SELECT DISTINCT e.id, e."conversationId", e."from", e."receivedDateTime"
       FROM crm_email e
@@ -38,173 +54,130 @@ const overall = await sql.query({
         AND d."isClosed" = false
     ),
     thread_first AS (
-      SELECT "conversationId",
-        MIN("receivedDateTime") as first_time,
-        (ARRAY_AGG("from" ORDER BY "receivedDateTime" ASC))[1] as first_sender
-      FROM deal_emails GROUP BY "conversationId"
+      SELECT DISTINCT ON ("conversationId")
+        "conversationId",
+        "receivedDateTime" as first_time,
+        "from" as first_sender
+      FROM deal_emails
+      ORDER BY "conversationId", "receivedDateTime" ASC
     ),
     initiated AS (
-      SELECT "conversationId", first_time FROM thread_first
+      SELECT "conversationId", first_time, first_sender
+      FROM thread_first
       WHERE first_sender LIKE '%@kiingo.com'
-    ),
-    replied AS (
-      SELECT DISTINCT i."conversationId"
-      FROM initiated i
-      JOIN deal_emails e ON e."conversationId" = i."conversationId"
-        AND e."from" NOT LIKE '%@kiingo.com'
-        AND e."receivedDateTime" > i.first_time
+        AND first_sender NOT ILIKE '%microsoftexchange%'
+        AND first_sender NOT ILIKE '%clientsolutions%'
+        AND first_sender NOT ILIKE '%support%'
     )
+    SELECT t."conversationId", t.first_time, t.first_sender,
+      TO_CHAR(t.first_time, 'YYYY-MM') as ym,
+      TO_CHAR(t.first_time, 'Mon') as month,
+      INITCAP(SPLIT_PART(t.first_sender, '@', 1)) as rep,
+      x.rt IS NOT NULL as has_reply,
+      x.rt as first_reply_time
+    FROM initiated t
+    LEFT JOIN LATERAL (
+      SELECT MIN(e2."receivedDateTime") rt
+      FROM crm_email e2
+      WHERE e2."conversationId" = t."conversationId"
+        AND e2."from" NOT LIKE '%@kiingo.com'
+        AND e2."receivedDateTime" > t.first_time
+    ) x ON true;
+    CREATE INDEX IF NOT EXISTS initiated_threads_conv ON initiated_threads ("conversationId");
+    ANALYZE initiated_threads;
+  `
+});
+```
+
+### Step 2: Overall response rate
+Replies are any external message in an initiated conversation after the first
+send; the conversations are deal-linked by construction, so `crm_email` can be
+probed directly by `conversationId`.
+
+```typescript
+const overall = await sql.query({
+  database: 'kiingo',
+  sql: `
     SELECT
-      (SELECT COUNT(*) FROM thread_first) as total_deal_threads,
-      (SELECT COUNT(*) FROM initiated) as total_initiated,
-      (SELECT COUNT(*) FROM replied) as total_replied,
-      ROUND((SELECT COUNT(*) FROM replied)::numeric / NULLIF((SELECT COUNT(*) FROM initiated), 0) * 100, 1) as rate
+      COUNT(*) as total_initiated,
+      COUNT(*) FILTER (WHERE has_reply) as total_replied,
+      ROUND(COUNT(*) FILTER (WHERE has_reply)::numeric / NULLIF(COUNT(*), 0) * 100, 1) as rate
+    FROM initiated_threads
   `
 });
 ```
 
-### Step 2: Response time statistics
+### Step 3: Response time statistics
 For threads that did get a reply, measure how long it took.
 
 ```typescript
 const timing = await sql.query({
   database: 'kiingo',
   sql: `
-    WITH deal_emails AS (
-      SELECT DISTINCT e.id, e."conversationId", e."from", e."receivedDateTime"
-      FROM crm_email e
-      JOIN crm_deal_email de ON de."crmEmailId" = e.id
-      JOIN crm_deal d ON d.id = de."crmDealId"
-      WHERE e."conversationId" IS NOT NULL
-        AND d."isClosed" = false
-    ),
-    thread_first AS (
-      SELECT "conversationId",
-        MIN("receivedDateTime") as first_time,
-        (ARRAY_AGG("from" ORDER BY "receivedDateTime" ASC))[1] as first_sender
-      FROM deal_emails GROUP BY "conversationId"
-    ),
-    initiated AS (
-      SELECT "conversationId", first_time FROM thread_first
-      WHERE first_sender LIKE '%@kiingo.com'
-    ),
-    first_reply AS (
-      SELECT i."conversationId", i.first_time,
-        MIN(e."receivedDateTime") as reply_time
-      FROM initiated i
-      JOIN deal_emails e ON e."conversationId" = i."conversationId"
-        AND e."from" NOT LIKE '%@kiingo.com'
-        AND e."receivedDateTime" > i.first_time
-      GROUP BY i."conversationId", i.first_time
+    WITH reply_hours AS (
+      SELECT EXTRACT(EPOCH FROM (first_reply_time - first_time)) / 3600 as h
+      FROM initiated_threads
+      WHERE has_reply
     )
     SELECT
-      ROUND(AVG(EXTRACT(EPOCH FROM (reply_time - first_time)) / 3600), 1) as avg_hours,
-      ROUND(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM (reply_time - first_time)) / 3600)::numeric, 1) as median_hours,
-      ROUND(PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM (reply_time - first_time)) / 3600)::numeric, 1) as p25_hours,
-      ROUND(PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM (reply_time - first_time)) / 3600)::numeric, 1) as p75_hours
-    FROM first_reply
+      AVG(h) as avg_hours,
+      PERCENTILE_CONT(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY h) as quartiles
+    FROM reply_hours
   `
 });
 ```
 
-### Step 3: Monthly response rate trend
+The array form sorts the reply-hours set once for all three quantiles instead
+of once per call. `quartiles` comes back as `[p25, median, p75]`; round each
+(and `avg_hours`) to one decimal when structuring the values.
+
+### Step 4: Monthly response rate trend
 Calculate response rate per month for the last 8 months.
 
 ```typescript
 const monthly = await sql.query({
   database: 'kiingo',
   sql: `
-    WITH deal_emails AS (
-      SELECT DISTINCT e.id, e."conversationId", e."from", e."receivedDateTime"
-      FROM crm_email e
-      JOIN crm_deal_email de ON de."crmEmailId" = e.id
-      JOIN crm_deal d ON d.id = de."crmDealId"
-      WHERE e."conversationId" IS NOT NULL
-        AND d."isClosed" = false
-    ),
-    thread_first AS (
-      SELECT "conversationId",
-        MIN("receivedDateTime") as first_time,
-        (ARRAY_AGG("from" ORDER BY "receivedDateTime" ASC))[1] as first_sender
-      FROM deal_emails GROUP BY "conversationId"
-    ),
-    initiated AS (
-      SELECT "conversationId", first_time,
-        TO_CHAR(first_time, 'YYYY-MM') as ym
-      FROM thread_first WHERE first_sender LIKE '%@kiingo.com'
-    ),
-    replied AS (
-      SELECT DISTINCT i."conversationId", i.ym
-      FROM initiated i
-      JOIN deal_emails e ON e."conversationId" = i."conversationId"
-        AND e."from" NOT LIKE '%@kiingo.com'
-        AND e."receivedDateTime" > i.first_time
-    )
     SELECT
-      i.ym as month,
-      COUNT(DISTINCT i."conversationId") as initiated,
-      COUNT(DISTINCT r."conversationId") as replied,
-      ROUND(COUNT(DISTINCT r."conversationId")::numeric / NULLIF(COUNT(DISTINCT i."conversationId"), 0) * 100, 1) as rate
-    FROM initiated i
-    LEFT JOIN replied r ON r."conversationId" = i."conversationId"
+      i.month,
+      COUNT(*) as initiated,
+      COUNT(*) FILTER (WHERE i.has_reply) as replied,
+      ROUND(COUNT(*) FILTER (WHERE i.has_reply)::numeric / NULLIF(COUNT(*), 0) * 100, 1) as rate
+    FROM initiated_threads i
     WHERE i.ym >= TO_CHAR(NOW() - INTERVAL '8 months', 'YYYY-MM')
-    GROUP BY i.ym ORDER BY i.ym
+    GROUP BY i.ym, i.month ORDER BY i.ym
   `
 });
 ```
 
-### Step 4: Per-rep response rate
+### Step 5: Per-rep response rate
 Response rate broken down by the Kiingo rep who initiated the thread. Exclude reps with fewer than 10 threads.
 
 ```typescript
 const byRep = await sql.query({
   database: 'kiingo',
   sql: `
-    WITH deal_emails AS (
-      SELECT DISTINCT e.id, e."conversationId", e."from", e."receivedDateTime"
-      FROM crm_email e
-      JOIN crm_deal_email de ON de."crmEmailId" = e.id
-      JOIN crm_deal d ON d.id = de."crmDealId"
-      WHERE e."conversationId" IS NOT NULL
-        AND d."isClosed" = false
-    ),
-    thread_first AS (
-      SELECT "conversationId",
-        MIN("receivedDateTime") as first_time,
-        (ARRAY_AGG("from" ORDER BY "receivedDateTime" ASC))[1] as first_sender
-      FROM deal_emails GROUP BY "conversationId"
-    ),
-    initiated AS (
-      SELECT "conversationId", first_time,
-        SPLIT_PART(first_sender, '@', 1) as rep
-      FROM thread_first WHERE first_sender LIKE '%@kiingo.com'
-    ),
-    replied AS (
-      SELECT DISTINCT i."conversationId", i.rep
-      FROM initiated i
-      JOIN deal_emails e ON e."conversationId" = i."conversationId"
-        AND e."from" NOT LIKE '%@kiingo.com'
-        AND e."receivedDateTime" > i.first_time
-    )
     SELECT
       i.rep,
-      COUNT(DISTINCT i."conversationId") as initiated,
-      COUNT(DISTINCT r."conversationId") as replied,
-      ROUND(COUNT(DISTINCT r."conversationId")::numeric / NULLIF(COUNT(DISTINCT i."conversationId"), 0) * 100, 1) as rate
-    FROM initiated i
-    LEFT JOIN replied r ON r."conversationId" = i."conversationId"
+      COUNT(*) as initiated,
+      COUNT(*) FILTER (WHERE i.has_reply) as replied,
+      ROUND(COUNT(*) FILTER (WHERE i.has_reply)::numeric / NULLIF(COUNT(*), 0) * 100, 1) as rate
+    FROM initiated_threads i
     GROUP BY i.rep
-    HAVING COUNT(DISTINCT i."conversationId") >= 10
-    ORDER BY COUNT(DISTINCT i."conversationId") DESC
+    HAVING COUNT(*) >= 10
+    ORDER BY COUNT(*) DESC
   `
 });
 ```
 
-### Step 5: Structure the data
+### Step 6: Structure the data
 
-For `monthlyData`, convert month strings to short labels (e.g. "2025-06" → "Jun", "2025-12" → "Dec", "2026-01" → "Jan"). Each entry: { month, initiated, replied, rate }.
-
-For `repData`, capitalize the first letter of the rep name. Exclude system accounts (names containing "MicrosoftExchange", "clientsolutions", "support"). Sort by initiated descending. Each entry: { rep, initiated, replied, rate }.
+The rows arrive formatted; no client-side transform is needed. Month labels
+are already short ("Jun"), rep names are already capitalized, system accounts
+(MicrosoftExchange, clientsolutions, support) are filtered out in Step 1, and
+the per-rep rows are sorted by initiated descending. Map them straight into
+`monthlyData` ({ month, initiated, replied, rate }) and `repData`
+({ rep, initiated, replied, rate }).
 
 ## Values to Return
 - `overallRate`: number (percentage)
@@ -298,83 +271,50 @@ rep_data = [
     {"rep": "Logan", "initiated": 100, "replied": 44, "rate": 44.0},
 ]
 
-initial_values = json.dumps({
-    "overallRate": 41.2,
-    "totalInitiated": 11952,
-    "totalReplied": 4929,
-    "medianReplyHours": 14.7,
-    "p25ReplyHours": 0.8,
-    "p75ReplyHours": 131.8,
-    "monthlyData": monthly_data,
-    "repData": rep_data,
-})
-
-
-def make_initial_html():
-    html = template_jsx
-    html = html.replace("OVERALL_RATE_PLACEHOLDER", "41.2")
-    html = html.replace("TOTAL_INITIATED_PLACEHOLDER", "11952")
-    html = html.replace("TOTAL_REPLIED_PLACEHOLDER", "4929")
-    html = html.replace("MEDIAN_REPLY_HOURS_PLACEHOLDER", "14.7")
-    html = html.replace("MONTHLY_DATA_PLACEHOLDER", json.dumps(monthly_data))
-    html = html.replace("REP_DATA_PLACEHOLDER", json.dumps(rep_data))
-    return html
-
-
-initial_html = make_initial_html()
+# Deferred until main() knows the metric is missing; the SKIP path never
+# serializes or renders anything.
+def _build_initial_payload():
+    initial_values = json.dumps({
+        "overallRate": 41.2,
+        "totalInitiated": 11952,
+        "totalReplied": 4929,
+        "medianReplyHours": 14.7,
+        "p25ReplyHours": 0.8,
+        "p75ReplyHours": 131.8,
+        "monthlyData": monthly_data,
+        "repData": rep_data,
+    })
+
+    html = render_template(template_jsx, {
+        "OVERALL_RATE_PLACEHOLDER": "41.2",
+        "TOTAL_INITIATED_PLACEHOLDER": "11952",
+        "TOTAL_REPLIED_PLACEHOLDER": "4929",
+        "MEDIAN_REPLY_HOURS_PLACEHOLDER": "14.7",
+        "MONTHLY_DATA_PLACEHOLDER": json.dumps(monthly_data),
+        "REP_DATA_PLACEHOLDER": json.dumps(rep_data),
+    })
+
+    return initial_values, html
 
 METADATA = json.dumps({
     "aliases": ["response rate", "email response rate", "reply rate", "outreach response"],
 })
 
 
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 86400,
+    "metadata_json": METADATA,
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 2, "layout_hint": "wide", "grid": (0, 14, 8, 12)},
+}
+
+
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA busy_timeout = 5000")
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
-            (metric_id, NAME, SLUG, instructions, template_jsx, 86400, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 2, "wide", 0, 14, 8, 12),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (8x12)")
-
-    conn.commit()
-    conn.close()
-    print("Done")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Seed: Sales Scorecard metric — pulls weekly sales data from Notion Leadership Team scorecard."""
 
-import sqlite3
-import uuid
 import json
-import os
-from datetime import datetime, timezone
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import render_template
+from _seed_helpers import run_seed
 
 SLUG = "sales-scorecard"
 NAME = "Sales Scorecard"
@@ -157,90 +153,57 @@ weeks_data = [
     {"week": "2/16", "discoveryCalls": 3, "nextStepsCalls": 10, "oppsCreated": 225750, "closedWon": 40700, "closeRate": 35.7, "avgDealSize": 2900},
 ]
 
-total_closed = sum(w["closedWon"] for w in weeks_data)
-latest = weeks_data[-1]
-
-initial_values = json.dumps({
-    "weeks": weeks_data,
-    "latestWeek": latest["week"],
-    "latestDiscovery": latest["discoveryCalls"],
-    "latestNextSteps": latest["nextStepsCalls"],
-    "latestClosedWon": latest["closedWon"],
-    "latestCloseRate": latest["closeRate"],
-    "latestOpps": latest["oppsCreated"],
-    "latestAvgDeal": latest["avgDealSize"],
-    "totalClosedWon": total_closed,
-})
-
-
-def make_initial_html():
-    html = template_jsx
-    html = html.replace("WEEKS_PLACEHOLDER", json.dumps(weeks_data))
-    html = html.replace("LATEST_WEEK_PLACEHOLDER", json.dumps(latest["week"]))
-    html = html.replace("LATEST_DISCOVERY_PLACEHOLDER", str(latest["discoveryCalls"]))
-    html = html.replace("LATEST_NEXT_STEPS_PLACEHOLDER", str(latest["nextStepsCalls"]))
-    html = html.replace("LATEST_CLOSED_WON_PLACEHOLDER", str(latest["closedWon"]))
-    html = html.replace("LATEST_CLOSE_RATE_PLACEHOLDER", str(latest["closeRate"]))
-    html = html.replace("LATEST_OPPS_PLACEHOLDER", str(latest["oppsCreated"]))
-    html = html.replace("LATEST_AVG_DEAL_PLACEHOLDER", str(latest["avgDealSize"]))
-    html = html.replace("TOTAL_CLOSED_WON_PLACEHOLDER", str(total_closed))
-    return html
-
-
-initial_html = make_initial_html()
+# Deferred until main() knows the metric is missing; the SKIP path never
+# aggregates, serializes, or renders anything.
+def _build_initial_payload():
+    total_closed = sum(w["closedWon"] for w in weeks_data)
+    latest = weeks_data[-1]
+
+    initial_values = json.dumps({
+        "weeks": weeks_data,
+        "latestWeek": latest["week"],
+        "latestDiscovery": latest["discoveryCalls"],
+        "latestNextSteps": latest["nextStepsCalls"],
+        "latestClosedWon": latest["closedWon"],
+        "latestCloseRate": latest["closeRate"],
+        "latestOpps": latest["oppsCreated"],
+        "latestAvgDeal": latest["avgDealSize"],
+        "totalClosedWon": total_closed,
+    })
+
+    html = render_template(template_jsx, {
+        "WEEKS_PLACEHOLDER": json.dumps(weeks_data),
+        "LATEST_WEEK_PLACEHOLDER": json.dumps(latest["week"]),
+        "LATEST_DISCOVERY_PLACEHOLDER": str(latest["discoveryCalls"]),
+        "LATEST_NEXT_STEPS_PLACEHOLDER": str(latest["nextStepsCalls"]),
+        "LATEST_CLOSED_WON_PLACEHOLDER": str(latest["closedWon"]),
+        "LATEST_CLOSE_RATE_PLACEHOLDER": str(latest["closeRate"]),
+        "LATEST_OPPS_PLACEHOLDER": str(latest["oppsCreated"]),
+        "LATEST_AVG_DEAL_PLACEHOLDER": str(latest["avgDealSize"]),
+        "TOTAL_CLOSED_WON_PLACEHOLDER": str(total_closed),
+    })
+
+    return initial_values, html
 
 METADATA = json.dumps({
     "aliases": ["sales scorecard", "sales metrics", "weekly sales"],
 })
 
 
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 259200,
+    "metadata_json": METADATA,
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 0, "layout_hint": "wide", "grid": (0, 0, 8, 12)},
+}
+
+
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA busy_timeout = 5000")
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
-            (metric_id, NAME, SLUG, instructions, template_jsx, 259200, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 0, "wide", 0, 0, 8, 12),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (8x12)")
-
-    conn.commit()
-    conn.close()
-    print("Done")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,8 @@
 #!/usr/bin/env python3
 """Seed: Trailing Follow-Up Calls metric + bind to follow-up-calls screen."""
 
-import sqlite3
-import uuid
-import json
-import os
-from datetime import datetime, timezone
-
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import dumps, render_template
+from _seed_helpers import run_seed
 
 SLUG = "trailing-followup-calls"
 NAME = "Trailing Follow-Up Calls"
@@ -31,18 +25,6 @@ weekly_data = [
     {"weekOf": "2026-02-16", "trailing30": 44},
 ]
 
-initial_values = json.dumps({
-    "trailing30": 44,
-    "peak": 44,
-    "peakWeek": "2026-02-09",
-    "trough": 0,
-    "troughWeek": "2025-11-24",
-    "total": 44,
-    "avgTrailing": 9,
-    "weeklyData": weekly_data,
-    "byMonth": {"2025-11": 0, "2025-12": 0, "2026-01": 8, "2026-02": 36},
-})
-
 instructions = r"""Compute trailing 30-day follow-up call metrics using dependency input from `weekly-followup-calls`. Do not call calendar APIs in this metric.
 
 ## Dependency Input
@@ -84,11 +66,12 @@ You will receive one dependency input:
 - `byMonth`: object of month -> count"""
 
 template_jsx = r"""(() => {
-  const data = DATA_PLACEHOLDER;
-  const current = CURRENT_PLACEHOLDER;
+  const weekly = WEEKLY_DATA_PLACEHOLDER;
+  const data = weekly.map(w => ({ week: w.weekOf.slice(5).replace('-', '/'), value: w.trailing30 }));
+  const current = TRAILING30_PLACEHOLDER;
   const peak = PEAK_PLACEHOLDER;
   const trough = TROUGH_PLACEHOLDER;
-  const avgValue = AVG_PLACEHOLDER;
+  const avgValue = AVG_TRAILING_PLACEHOLDER;
 
   return (
     <MetricSection>
@@ -120,108 +103,43 @@ template_jsx = r"""(() => {
   );
 })()"""
 
-chart_data = json.dumps([
-    {"week": w["weekOf"][5:].replace("-", "/"), "value": w["trailing30"]}
-    for w in weekly_data
-])
-
-initial_html = f"""(() => {{
-  const data = {chart_data};
-  const current = 44;
-  const peak = 44;
-  const trough = 0;
-  const avgValue = 9;
-
-  return (
-    <MetricSection>
-      <MetricRow>
-        <StatCard label="Current" value={{current}} subtitle="Trailing 30d" />
-        <StatCard label="Peak" value={{peak}} subtitle="Best week" />
-        <StatCard label="Trough" value={{trough}} subtitle="Lowest week" />
-      </MetricRow>
-      <div style={{{{ height: 320, background: theme.panel, borderRadius: 16, padding: 20, border: `1px solid ${{theme.line}}` }}}}>
-        <ResponsiveContainer width="100%" height="100%">
-          <AreaChart data={{data}} margin={{{{ top: 10, right: 10, left: 0, bottom: 0 }}}}>
-            <defs>
-              <linearGradient id="followupGradient" x1="0" y1="0" x2="0" y2="1">
-                <stop offset="0%" stopColor={{theme.secondary}} stopOpacity={{0.3}} />
-                <stop offset="100%" stopColor={{theme.secondary}} stopOpacity={{0.02}} />
-              </linearGradient>
-            </defs>
-            <CartesianGrid strokeDasharray="3 3" stroke={{theme.gridStroke}} />
-            <XAxis dataKey="week" stroke={{theme.axisStroke}} tick={{{{ fill: theme.inkMuted, fontSize: 11 }}}} interval={{2}} />
-            <YAxis stroke={{theme.axisStroke}} tick={{{{ fill: theme.inkMuted, fontSize: 11 }}}} domain={{[0, 'auto']}} />
-            <Tooltip contentStyle={{{{ background: theme.tooltipBg, border: `1px solid ${{theme.tooltipBorder}}`, color: theme.tooltipText, borderRadius: 8, fontSize: 13 }}}} />
-            <ReferenceLine y={{avgValue}} stroke={{theme.line}} strokeDasharray="6 4" />
-            <Area type="monotone" dataKey="value" stroke={{theme.secondary}} strokeWidth={{2.5}} fill="url(#followupGradient)" dot={{{{ fill: theme.secondary, r: 3, strokeWidth: 0 }}}} activeDot={{{{ fill: theme.accentStrong, r: 5, strokeWidth: 2, stroke: theme.line }}}} />
-          </AreaChart>
-        </ResponsiveContainer>
-      </div>
-      <MetricNote>Each point = trailing 30-day follow-up calls · Source: Weekly Follow-Up Calls dependency (calendar-derived)</MetricNote>
-    </MetricSection>
-  );
-}})()"""
+# Deferred until main() knows the metric is missing; the SKIP path never
+# serializes or renders anything.
+def _build_initial_payload():
+    initial_values = dumps({
+        "trailing30": 44,
+        "peak": 44,
+        "peakWeek": "2026-02-09",
+        "trough": 0,
+        "troughWeek": "2025-11-24",
+        "total": 44,
+        "avgTrailing": 9,
+        "weeklyData": weekly_data,
+        "byMonth": {"2025-11": 0, "2025-12": 0, "2026-01": 8, "2026-02": 36},
+    })
+
+    # rendered_html stays empty; the app renders template_html from these
+    # values on read (renderMetricTemplate), so the snapshot row doesn't
+    # carry a second copy of the JSX.
+    return initial_values, ""
+
+METADATA = dumps({"dependencies": ["weekly-followup-calls"]})
+
+
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 3600,
+    "metadata_json": METADATA,
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 1, "layout_hint": "wide", "grid": (0, 15, 8, 7)},
+}
 
 
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    # Check if metric already exists
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        # Still try to bind to screen
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
-            (
-                metric_id,
-                NAME,
-                SLUG,
-                instructions,
-                template_jsx,
-                3600,
-                json.dumps({"dependencies": ["weekly-followup-calls"]}),
-                NOW,
-                NOW,
-            ),
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    # Bind to screen if not already bound
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 1, "wide", 0, 15, 8, 7),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (8x7)")
-
-    conn.commit()
-    conn.close()
-    print("\nDone")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Seed: Upcoming Cohort Calendar — scheduled cohorts and active office hours from Asana + Calendar."""
 
-import sqlite3
-import uuid
-import json
-import os
-from datetime import datetime, timezone
+import sys
 
-DB_PATH = os.path.expanduser("~/Library/Application Support/com.kiingo.localcli/state.sqlite")
-NOW = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+from _seed_common import dumps
+from _seed_helpers import run_seed
 
 SLUG = "upcoming-cohort-calendar"
 NAME = "Upcoming Cohort Calendar"
@@ -87,7 +83,7 @@ Group office hours events by week (Mon-Sun). For each week: { week (short label
 template_jsx = r"""(() => {
   const activeCount = ACTIVE_COUNT_PLACEHOLDER;
   const scheduledCount = SCHEDULED_COUNT_PLACEHOLDER;
-  const officeHourCohorts = OH_COHORTS_PLACEHOLDER;
+  const officeHourCohorts = OFFICE_HOUR_COHORTS_PLACEHOLDER;
   const totalSessions = TOTAL_SESSIONS_PLACEHOLDER;
   const activeCohorts = ACTIVE_COHORTS_PLACEHOLDER;
   const scheduledCohorts = SCHEDULED_COHORTS_PLACEHOLDER;
@@ -147,51 +143,42 @@ template_jsx = r"""(() => {
 
 # ---------- Initial snapshot data ----------
 
-active_cohorts = [
-    {"name": "DealNews Cohort 1", "instructor": "Isabelle"},
-    {"name": "DealNews Cohort 2", "instructor": "Isabelle"},
-    {"name": "DealNews Cohort 3", "instructor": "Isabelle"},
-    {"name": "Total Package HR", "instructor": "Isabelle"},
-    {"name": "SPMB Cohort 3", "instructor": "Isabelle"},
-    {"name": "02.04 Cohort", "instructor": "—"},
-    {"name": "02.13.26 Cohort", "instructor": "—"},
-    {"name": "02.25.26 Cohort", "instructor": "—"},
-    {"name": "01.20.26 Cohort", "instructor": "—"},
-    {"name": "01.05.26 Cohort", "instructor": "—"},
-    {"name": "85C Bakery", "instructor": "—"},
-    {"name": "Anderson Howard", "instructor": "—"},
-    {"name": "Preservation Equity", "instructor": "James"},
-    {"name": "Heller Consulting", "instructor": "—"},
-    {"name": "DMT Law Firm", "instructor": "—"},
-    {"name": "Cush Plaza Properties", "instructor": "—"},
-    {"name": "Gibbs Construction", "instructor": "—"},
-    {"name": "SVN", "instructor": "—"},
-    {"name": "Phoenix Manufacturing", "instructor": "—"},
-    {"name": "Immatics 1", "instructor": "—"},
-    {"name": "Immatics 2", "instructor": "—"},
-    {"name": "InOvate", "instructor": "—"},
-    {"name": "Netgain", "instructor": "—"},
-    {"name": "Parron Hall", "instructor": "—"},
-    {"name": "Partner4Work", "instructor": "—"},
-    {"name": "Sadoff", "instructor": "—"},
-    {"name": "Scimitar", "instructor": "—"},
-    {"name": "10 Fitness", "instructor": "—"},
-    {"name": "Total Environmental Mgmt", "instructor": "—"},
-    {"name": "True Movement Tech", "instructor": "—"},
-    {"name": "Tarlton", "instructor": "—"},
-    {"name": "Statewide PA", "instructor": "—"},
-    {"name": "Anglepoint", "instructor": "—"},
-    {"name": "Citadel CPM", "instructor": "—"},
-    {"name": "Nolan Consulting", "instructor": "—"},
-    {"name": "12.02 Marketing", "instructor": "—"},
-    {"name": "12.05 Cohort", "instructor": "—"},
-    {"name": "12.12 Cohort", "instructor": "—"},
-    {"name": "12.18 Cohort", "instructor": "—"},
-    {"name": "11.19 Cohort", "instructor": "—"},
-    {"name": "01.14.26 Cohort", "instructor": "—"},
-    {"name": "01.26.26 Agents", "instructor": "—"},
+# The em-dash is non-ASCII, so CPython doesn't auto-intern it the way it does
+# the ASCII literals; one interned object backs all 36 unassigned rows.
+DASH = sys.intern("\u2014")
+
+# Only six cohorts have a named instructor; everyone else shows the dash.
+# Building the rows from one name list (in display order) keeps the
+# import to a single comprehension instead of 42 dict literals.
+_INSTRUCTORS = {
+    "DealNews Cohort 1": "Isabelle",
+    "DealNews Cohort 2": "Isabelle",
+    "DealNews Cohort 3": "Isabelle",
+    "Total Package HR": "Isabelle",
+    "SPMB Cohort 3": "Isabelle",
+    "Preservation Equity": "James",
+}
+
+_COHORT_NAMES = [
+    "DealNews Cohort 1", "DealNews Cohort 2", "DealNews Cohort 3",
+    "Total Package HR", "SPMB Cohort 3", "02.04 Cohort",
+    "02.13.26 Cohort", "02.25.26 Cohort", "01.20.26 Cohort",
+    "01.05.26 Cohort", "85C Bakery", "Anderson Howard",
+    "Preservation Equity", "Heller Consulting", "DMT Law Firm",
+    "Cush Plaza Properties", "Gibbs Construction", "SVN",
+    "Phoenix Manufacturing", "Immatics 1", "Immatics 2",
+    "InOvate", "Netgain", "Parron Hall",
+    "Partner4Work", "Sadoff", "Scimitar",
+    "10 Fitness", "Total Environmental Mgmt", "True Movement Tech",
+    "Tarlton", "Statewide PA", "Anglepoint",
+    "Citadel CPM", "Nolan Consulting", "12.02 Marketing",
+    "12.05 Cohort", "12.12 Cohort", "12.18 Cohort",
+    "11.19 Cohort", "01.14.26 Cohort", "01.26.26 Agents",
 ]
 
+active_cohorts = [{"name": n, "instructor": _INSTRUCTORS.get(n, DASH)} for n in _COHORT_NAMES]
+
+
 scheduled_cohorts = []
 
 weekly_density = [
@@ -205,83 +192,47 @@ weekly_density = [
     {"week": "4/6", "sessions": 25},
 ]
 
-initial_values = json.dumps({
-    "activeCount": 42,
-    "scheduledCount": 0,
-    "officeHourCohorts": 42,
-    "totalSessions": 315,
-    "activeCohorts": active_cohorts,
-    "scheduledCohorts": scheduled_cohorts,
-    "weeklyDensity": weekly_density,
+METADATA = dumps({
+    "aliases": ["upcoming cohorts", "cohort calendar", "bootcamp schedule", "office hours schedule"],
 })
 
+# Deferred until main() knows the metric is missing; the SKIP path never
+# serializes or renders anything.
+def _build_initial_payload():
+    # Each list is serialized exactly once; the same strings are spliced into
+    # both values_json and the template substitutions, so the snapshot and
+    # the rendered HTML can never diverge byte-for-byte.
+    active_cohorts_json = dumps(active_cohorts)
+    scheduled_cohorts_json = dumps(scheduled_cohorts)
+    weekly_density_json = dumps(weekly_density)
+
+    initial_values = (
+        '{"activeCount":42,"scheduledCount":0,"officeHourCohorts":42,"totalSessions":315,'
+        '"activeCohorts":' + active_cohorts_json
+        + ',"scheduledCohorts":' + scheduled_cohorts_json
+        + ',"weeklyDensity":' + weekly_density_json + "}"
+    )
 
-def make_initial_html():
-    html = template_jsx
-    html = html.replace("ACTIVE_COUNT_PLACEHOLDER", "42")
-    html = html.replace("SCHEDULED_COUNT_PLACEHOLDER", "0")
-    html = html.replace("OH_COHORTS_PLACEHOLDER", "42")
-    html = html.replace("TOTAL_SESSIONS_PLACEHOLDER", "315")
-    html = html.replace("ACTIVE_COHORTS_PLACEHOLDER", json.dumps(active_cohorts))
-    html = html.replace("SCHEDULED_COHORTS_PLACEHOLDER", json.dumps(scheduled_cohorts))
-    html = html.replace("WEEKLY_DENSITY_PLACEHOLDER", json.dumps(weekly_density))
-    return html
-
+    # rendered_html stays empty; the app renders template_html from these
+    # values on read (renderMetricTemplate), so the snapshot row doesn't
+    # carry a second copy of the cohort list inline in JSX.
+    return initial_values, ""
 
-initial_html = make_initial_html()
 
-METADATA = json.dumps({
-    "aliases": ["upcoming cohorts", "cohort calendar", "bootcamp schedule", "office hours schedule"],
-})
+SEED = {
+    "slug": SLUG,
+    "name": NAME,
+    "instructions": instructions,
+    "template_html": template_jsx,
+    "ttl_seconds": 43200,
+    "metadata_json": METADATA,
+    "build_payload": _build_initial_payload,
+    "screen": {"screen_id": SCREEN_ID, "position": 5, "layout_hint": "wide", "grid": (0, 60, 8, 16)},
+}
 
 
 def main():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA busy_timeout = 5000")
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM metric_definitions WHERE slug = ?", (SLUG,))
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} (already exists)")
-        cursor.execute("SELECT id FROM metric_definitions WHERE slug = ?", (SLUG,))
-        metric_id = cursor.fetchone()[0]
-    else:
-        metric_id = str(uuid.uuid4())
-        snapshot_id = str(uuid.uuid4())
-
-        cursor.execute(
-            """INSERT INTO metric_definitions
-               (id, name, slug, instructions, template_html, ttl_seconds, provider, enabled, proactive, metadata_json, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, 'claude', 1, 0, ?, ?, ?)""",
-            (metric_id, NAME, SLUG, instructions, template_jsx, 43200, METADATA, NOW, NOW)
-        )
-        cursor.execute(
-            """INSERT INTO metric_snapshots
-               (id, metric_id, values_json, rendered_html, status, created_at, completed_at)
-               VALUES (?, ?, ?, ?, 'completed', ?, ?)""",
-            (snapshot_id, metric_id, initial_values, initial_html, NOW, NOW)
-        )
-        print(f"  ADD   {SLUG}")
-
-    cursor.execute(
-        "SELECT COUNT(*) FROM screen_metrics WHERE screen_id = ? AND metric_id = ?",
-        (SCREEN_ID, metric_id),
-    )
-    if cursor.fetchone()[0] > 0:
-        print(f"  SKIP  {SLUG} already bound to {SCREEN_ID}")
-    else:
-        binding_id = str(uuid.uuid4())
-        cursor.execute(
-            """INSERT INTO screen_metrics
-               (id, screen_id, metric_id, position, layout_hint, grid_x, grid_y, grid_w, grid_h)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (binding_id, SCREEN_ID, metric_id, 5, "wide", 0, 60, 8, 16),
-        )
-        print(f"  BIND  {SLUG} -> {SCREEN_ID} (8x16)")
-
-    conn.commit()
-    conn.close()
-    print("Done")
+    run_seed(SEED)
 
 
 if __name__ == "__main__":
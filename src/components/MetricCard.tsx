@@ -4,6 +4,7 @@ import * as Recharts from "recharts";
 import { useAppActions, useAppState } from "../state/appState";
 import type { MetricDefinition, MetricDiagnostics, SaveMetricDefinitionPayload, ScreenMetricView } from "../lib/types";
 import { getMetricDiagnostics } from "../lib/tauriClient";
+import { renderMetricTemplate } from "../lib/metricTemplate";
 import { StatCard, MetricSection, MetricRow, MetricText, MetricNote } from "./MetricComponents";
 
 const METRIC_THEME = {
@@ -608,7 +609,14 @@ export function MetricCard({ view, onRemove }: MetricCardProps): JSX.Element {
     );
   }
 
-  if (!latestSnapshot || !latestSnapshot.renderedHtml) {
+  // Snapshots may skip rendered_html and rely on the definition's template
+  // plus their values; render those on read instead of showing "No data yet".
+  const snapshotCode = latestSnapshot
+    ? latestSnapshot.renderedHtml ||
+      renderMetricTemplate(definition.templateHtml, latestSnapshot.valuesJson)
+    : "";
+
+  if (!latestSnapshot || !snapshotCode) {
     return (
       <div className="metric-card metric-stale">
         <div className="metric-card-header">
@@ -657,7 +665,7 @@ export function MetricCard({ view, onRemove }: MetricCardProps): JSX.Element {
           front={(
             <>
               {refreshError && <p className="metric-error-text">{refreshError}</p>}
-              <MemoizedLiveChart code={latestSnapshot.renderedHtml} />
+              <MemoizedLiveChart code={snapshotCode} />
             </>
           )}
           back={diagnosticsBack}
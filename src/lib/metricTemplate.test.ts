@@ -0,0 +1,28 @@
+import { describe, expect, it } from "vitest";
+import { renderMetricTemplate } from "./metricTemplate";
+
+describe("renderMetricTemplate", () => {
+  it("substitutes placeholders with JSON-encoded values", () => {
+    const out = renderMetricTemplate(
+      "const total = TOTAL_REVENUE_PLACEHOLDER; const label = MONTH_LABEL_PLACEHOLDER;",
+      { totalRevenue: 76799, monthLabel: "February 2026" }
+    );
+    expect(out).toBe('const total = 76799; const label = "February 2026";');
+  });
+
+  it("inlines arrays and objects", () => {
+    const out = renderMetricTemplate("const rows = BY_SERVICE_PLACEHOLDER;", {
+      byService: [{ service: "Bootcamp", revenue: 9600 }]
+    });
+    expect(out).toBe('const rows = [{"service":"Bootcamp","revenue":9600}];');
+  });
+
+  it("leaves tokens without a matching value intact", () => {
+    const out = renderMetricTemplate("const x = MISSING_PLACEHOLDER;", { present: 1 });
+    expect(out).toBe("const x = MISSING_PLACEHOLDER;");
+  });
+
+  it("returns empty string for an empty template", () => {
+    expect(renderMetricTemplate("", { anything: 1 })).toBe("");
+  });
+});
@@ -0,0 +1,27 @@
+const PLACEHOLDER_RE = /([A-Z][A-Z0-9_]*)_PLACEHOLDER/g;
+
+function placeholderKey(name: string): string {
+  return name.toLowerCase().replace(/_([a-z0-9])/g, (_, ch: string) => ch.toUpperCase());
+}
+
+/**
+ * Fill a metric definition's FOO_BAR_PLACEHOLDER tokens from a snapshot's
+ * values (keyed camelCase, e.g. `fooBar`). Values are inlined as JSON, which
+ * is how the seeded snapshots substitute them. Tokens without a matching
+ * value are left intact so a partial render is visible rather than invalid.
+ */
+export function renderMetricTemplate(
+  templateHtml: string,
+  values: Record<string, unknown>
+): string {
+  if (!templateHtml) {
+    return "";
+  }
+  return templateHtml.replace(PLACEHOLDER_RE, (token, name: string) => {
+    const key = placeholderKey(name);
+    if (!(key in values)) {
+      return token;
+    }
+    return JSON.stringify(values[key]);
+  });
+}